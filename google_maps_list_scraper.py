@@ -11,40 +11,312 @@ Based on live inspection of Google Maps HTML structure:
 - Notes appear as expanded text below selected items OR in textarea elements
 
 Requirements:
-    pip install selenium webdriver-manager pandas
+    pip install selenium webdriver-manager
+    pip install orjson  # optional, faster JSON output
+    pip install pandas  # optional, only for return_format='dataframe'
 
 Usage:
     python google_maps_list_scraper.py --url "YOUR_URL" --city "Barcelona" --output "output.json"
+    python google_maps_list_scraper.py --urls-file lists.txt --workers 4 --output "output.json"
 """
 
 import argparse
+import csv
 import json
 import re
-import time
+import shutil
 import timeit
-from typing import Optional, List, Dict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, List, Dict, Tuple
 import os
 
-import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     StaleElementReferenceException,
-    ElementClickInterceptedException
+    ElementClickInterceptedException,
+    SessionNotCreatedException,
+    WebDriverException
 )
-from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def setup_driver(headless: bool = True) -> webdriver.Chrome:
-    """Initialize Chrome WebDriver."""
+
+# Column order for returned records and output files
+COLUMN_ORDER = ['city', 'place', 'address', 'category', 'rating', 'review_count',
+                'price_range', 'note', 'phone', 'website', 'lat', 'lng', 'url']
+
+# Where the resolved chromedriver path is remembered between runs
+_DRIVER_PATH_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'sharedlist_scraper', 'chromedriver_path.txt')
+
+# Requests the scraper never needs: images, place photos, fonts and media.
+# Stylesheets are kept since clicking places depends on layout.
+_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.webp', '*.gif',
+    '*googleusercontent.com/*',
+    '*.woff', '*.woff2', '*.ttf', '*fonts.gstatic.com/*',
+    '*.mp4', '*.webm',
+]
+
+# Words that indicate utility buttons (not places), matched in a single scan
+_SKIP_RE = re.compile(
+    r'delete|share|add a place|joined|edit|more options|note|close|back|search|menu|collapse|add note',
+    re.IGNORECASE
+)
+
+# Exact place names (lowercased) that are utility buttons, and lines that are
+# never part of a note; frozensets so each check is a single hash lookup
+_SKIP_NAMES = frozenset({'delete', 'share', 'add a place', 'joined', 'note', 'add note'})
+_NOTE_SKIP_LINES = frozenset({'delete', 'note', 'add note', '+'})
+
+# CSS selectors shared by the Python lookups and the in-browser scripts
+_PLACE_BUTTON_SELECTOR = 'main button'
+_RATING_IMG_SELECTOR = 'img[aria-label*="star"]'
+_NOTE_SELECTOR = 'textarea[aria-label="Note"]'
+_PLACE_LINK_SELECTOR = 'a[href*="/maps/place/"]'
+
+# Precompiled patterns used for every place
+_RATING_RE = re.compile(r'(\d+\.?\d*)\s*stars?\s*([0-9,]+)\s*Reviews?', re.IGNORECASE)
+_LATLNG_RE = re.compile(r'@(-?\d+\.?\d*),(-?\d+\.?\d*)')
+_HAS_DIGIT = re.compile(r'\d').search
+_NUM_RE = re.compile(r'^\d+\.?\d*$')
+_PAREN_NUM_RE = re.compile(r'^\([0-9,]+\)$')
+_PRICE_RE = re.compile(r'^[€$£¥]')
+_NUMPUNCT_RE = re.compile(r'^[\d\.\(\)]+$')
+
+# Keep scrolling the list panel until the number of distinct button names
+# stops changing for three rounds (or max scrolls is hit). After each scroll,
+# wait until no request has finished for 500 ms, at most the scroll pause.
+# Requests still in flight leave no timing entries, so a round only counts
+# as unchanged once the full scroll pause has passed without new names.
+# Names are remembered across rounds, so rows the list unloads still count.
+_SCROLL_UNTIL_STABLE_JS = """
+const [panel, selector, pauseMs, maxScrolls] = arguments;
+const done = arguments[arguments.length - 1];
+const names = new Set();
+let lastCount = 0, unchanged = 0, scrolls = 0, scrolledAt = 0;
+
+function settle(callback) {
+    const start = Date.now();
+    let quietSince = start;
+    performance.clearResourceTimings();
+    (function poll() {
+        const now = Date.now();
+        if (performance.getEntriesByType('resource').length) {
+            performance.clearResourceTimings();
+            quietSince = now;
+        }
+        if (now - quietSince >= 500 || now - start >= pauseMs) return callback();
+        setTimeout(poll, 100);
+    })();
+}
+
+function step() {
+    document.querySelectorAll(selector).forEach(b => {
+        const name = (b.innerText || '').trim().split('\\n')[0];
+        if (name) names.add(name);
+    });
+    if (names.size !== lastCount) {
+        unchanged = 0;
+        lastCount = names.size;
+    } else if (scrolls > 0 && Date.now() - scrolledAt < pauseMs) {
+        // Nothing new yet, but a slow page may still be on its way
+        return setTimeout(step, 100);
+    } else if (++unchanged >= 3) {
+        return done(scrolls);
+    }
+    if (scrolls >= maxScrolls) return done(scrolls);
+    
+    panel.scrollTop = panel.scrollHeight;
+    window.scrollTo(0, document.body.scrollHeight);
+    scrolls++;
+    scrolledAt = Date.now();
+    settle(step);
+}
+
+step();
+"""
+
+# Every list button with its text, aria-label and rating label, fetched in
+# one round-trip
+_LIST_BUTTONS_JS = """
+const [buttonSelector, ratingSelector, linkSelector] = arguments;
+return Array.from(document.querySelectorAll(buttonSelector), b => {
+    const ratingImg = b.querySelector(ratingSelector);
+    const link = b.closest(linkSelector) || b.querySelector(linkSelector);
+    return [
+        b,
+        b.innerText || '',
+        b.getAttribute('aria-label') || '',
+        ratingImg ? ratingImg.getAttribute('aria-label') : null,
+        link ? link.href : null
+    ];
+});
+"""
+
+# First N characters of the page text, cut in the browser
+_BODY_TEXT_PREVIEW_JS = "return document.body ? document.body.innerText.slice(0, arguments[0]) : '';"
+
+# The index-th place button with its text, rating label and place link. Applies the
+# same filter as is_place_button, using _SKIP_RE's pattern, in the browser
+# so only one row comes back.
+_PLACE_BUTTON_AT_JS = """
+const [buttonSelector, ratingSelector, linkSelector, skipPattern, index] = arguments;
+const skip = new RegExp(skipPattern, 'i');
+const places = Array.from(document.querySelectorAll(buttonSelector)).filter(b => {
+    const text = b.innerText || '';
+    return !skip.test(b.getAttribute('aria-label') || '') && !skip.test(text) && text.trim().length > 1;
+});
+const button = places[index];
+if (!button) return null;
+const ratingImg = button.querySelector(ratingSelector);
+const link = button.closest(linkSelector) || button.querySelector(linkSelector);
+return [
+    button,
+    button.innerText || '',
+    ratingImg ? ratingImg.getAttribute('aria-label') : null,
+    link ? link.href : null
+];
+"""
+
+# Text and rating label of a place button, read together before clicking
+_PLACE_BUNDLE_JS = """
+const button = arguments[0];
+const ratingImg = button.querySelector(arguments[1]);
+return {
+    text: button.innerText,
+    ratingAria: ratingImg ? ratingImg.getAttribute('aria-label') : null
+};
+"""
+
+# Everything fast mode needs from every list button, in one call
+_FAST_EXTRACT_JS = """
+const [buttonSelector, ratingSelector, noteSelector, linkSelector] = arguments;
+return Array.from(document.querySelectorAll(buttonSelector), b => {
+    const ratingImg = b.querySelector(ratingSelector);
+    const link = b.closest(linkSelector) || b.querySelector(linkSelector);
+    const note = b.parentElement && b.parentElement.querySelector(noteSelector);
+    return {
+        text: b.innerText || '',
+        aria: b.getAttribute('aria-label') || '',
+        ratingAria: ratingImg ? ratingImg.getAttribute('aria-label') : null,
+        href: link ? link.href : null,
+        note: note ? (note.value || note.textContent) : null,
+        hasNoteArea: !!note
+    };
+});
+"""
+
+# Whether a note textarea next to a place button has text in it (an empty
+# textarea may be rendered before its note has loaded)
+_NOTE_FILLED_JS = """
+const parent = arguments[0].parentElement;
+if (!parent) return false;
+return Array.from(parent.querySelectorAll(arguments[1]))
+    .some(area => (area.value || area.textContent || '').trim().length > 0);
+"""
+
+# Read everything the note lookup needs after a click in one call: the first
+# non-empty note textarea next to the button, plus the grandparent and button
+# text, instead of XPath parent lookups and a round-trip per element
+_NOTE_BUNDLE_JS = """
+const button = arguments[0];
+const parent = button.parentElement;
+const grandparent = parent && parent.parentElement;
+let textarea = null;
+if (parent) {
+    for (const area of parent.querySelectorAll(arguments[1])) {
+        const text = (area.value || area.textContent || '').trim();
+        if (text) { textarea = text; break; }
+    }
+}
+return {
+    textarea: textarea,
+    grandparentText: grandparent ? grandparent.innerText : '',
+    buttonText: button.innerText
+};
+"""
+
+
+def dump_json(obj, indent: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def get_chromedriver_path(refresh: bool = False) -> str:
+    """
+    Resolve the chromedriver binary without a version check on every run.
+    
+    Uses $CHROMEDRIVER_PATH if set, then the path cached by an earlier run,
+    then a chromedriver on PATH, and only asks webdriver_manager (which
+    checks for updates over HTTP) when none is available or refresh is True.
+    The cache is only written after a refresh, so it comes before PATH:
+    once a PATH driver has been rejected for not matching Chrome, later
+    runs go straight to the driver that replaced it.
+    """
+    env_path = os.environ.get('CHROMEDRIVER_PATH')
+    if env_path:
+        return env_path
+    
+    if not refresh:
+        try:
+            with open(_DRIVER_PATH_CACHE, encoding='utf-8') as f:
+                cached_path = f.read().strip()
+            if cached_path and os.path.isfile(cached_path):
+                return cached_path
+        except OSError:
+            pass
+        
+        path_driver = shutil.which('chromedriver')
+        if path_driver:
+            return path_driver
+    
+    # Imported here so runs that never start a browser skip it
+    from webdriver_manager.chrome import ChromeDriverManager
+    
+    driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(_DRIVER_PATH_CACHE), exist_ok=True)
+        with open(_DRIVER_PATH_CACHE, 'w', encoding='utf-8') as f:
+            f.write(driver_path)
+    except OSError:
+        pass
+    return driver_path
+
+
+def _block_heavy_requests(driver: webdriver.Chrome) -> None:
+    """
+    Block images, fonts and media at the network layer for the current tab.
+    
+    The content-setting prefs do not cover fonts, video or CSS background
+    images. CDP settings only apply to the tab that is current when they are
+    sent, so this must run again for every new tab.
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+    except WebDriverException:
+        pass
+
+
+def setup_driver(headless: bool = True, driver_path: Optional[str] = None) -> webdriver.Chrome:
+    """
+    Initialize Chrome WebDriver.
+    
+    driver_path skips chromedriver resolution, so threads starting browsers
+    together can share one path resolved up front.
+    """
     chrome_options = Options()
     
     if headless:
@@ -58,22 +330,75 @@ def setup_driver(headless: bool = True) -> webdriver.Chrome:
     chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     chrome_options.add_argument("--lang=en-US")
     chrome_options.add_argument("--log-level=3")
+    # Switch off subsystems a scrape never uses to save memory and bandwidth.
+    # Rating <img> elements stay in the DOM with images off, so their
+    # aria-labels can still be read
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--metrics-recording-only")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--disable-features=TranslateUI,MediaRouter")
     chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.implicitly_wait(5)
+    # Return from driver.get() at DOMContentLoaded instead of waiting for
+    # map tiles and trailing XHRs; wait_for_list_load gates on the list itself
+    chrome_options.page_load_strategy = 'eager'
+    
+    # Place data is text-only: skip images and notification prompts.
+    # Stylesheets stay enabled since clicking places depends on layout.
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    
+    try:
+        service = Service(driver_path or get_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    except SessionNotCreatedException:
+        # An explicit driver_path or $CHROMEDRIVER_PATH is used as-is, so a
+        # refresh would only return it again
+        if driver_path or os.environ.get('CHROMEDRIVER_PATH'):
+            raise
+        # Cached driver no longer matches the installed Chrome
+        service = Service(get_chromedriver_path(refresh=True))
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+    _block_heavy_requests(driver)
+    
+    # No implicit wait: a lookup that misses should fail immediately rather
+    # than block for seconds; loading is handled by explicit WebDriverWaits
+    driver.implicitly_wait(0)
+    
+    # Bound how long a hung page load can stall the run (Chrome's default is
+    # 300s); see load_list_url for the initial load of a list
+    driver.set_page_load_timeout(15)
     
     return driver
 
 
+def load_list_url(driver: webdriver.Chrome, url: str) -> None:
+    """
+    Open a list URL, tolerating the page load timeout.
+    
+    A slow page is stopped rather than failing the scrape, since
+    wait_for_list_load waits on the list itself afterwards.
+    """
+    try:
+        driver.get(url)
+    except TimeoutException:
+        print("Page load timed out, continuing with what has loaded")
+        driver.execute_script('window.stop();')
+
+
 def wait_for_list_load(driver: webdriver.Chrome, timeout: int = 30) -> bool:
     """Wait for the Google Maps list to load."""
     print("Waiting for list to load...")
     
     # Try multiple selectors - Google Maps structure can vary
     selectors_to_try = [
-        'main button',
+        _PLACE_BUTTON_SELECTOR,
         'div[role="main"] button',
         'button[data-item-id]',
         'div[aria-label] button',
@@ -81,16 +406,20 @@ def wait_for_list_load(driver: webdriver.Chrome, timeout: int = 30) -> bool:
         'div.section-layout button',
     ]
     
-    # First wait for basic page load
-    time.sleep(5)
-    
     try:
         # Wait for main content area
         WebDriverWait(driver, timeout).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, 'main, div[role="main"]'))
         )
         print("Main content area found")
-        time.sleep(3)
+        
+        # Give the place buttons a chance to render, returning as soon as they do
+        try:
+            WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _PLACE_BUTTON_SELECTOR))
+            )
+        except TimeoutException:
+            pass
         
         # Try to find place buttons with multiple selectors
         for selector in selectors_to_try:
@@ -99,11 +428,11 @@ def wait_for_list_load(driver: webdriver.Chrome, timeout: int = 30) -> bool:
                 if elements and len(elements) > 0:
                     print(f"Found elements with selector: {selector}")
                     return True
-            except:
+            except WebDriverException:
                 continue
         
         # Fallback: just check if there's any content
-        body_text = driver.find_element(By.TAG_NAME, 'body').text
+        body_text = driver.execute_script(_BODY_TEXT_PREVIEW_JS, 101)
         if len(body_text) > 100:
             print("Page has content, proceeding...")
             return True
@@ -117,109 +446,87 @@ def wait_for_list_load(driver: webdriver.Chrome, timeout: int = 30) -> bool:
         return True
 
 
-def get_place_buttons(driver: webdriver.Chrome) -> List:
-    """Get all place buttons from the list, filtering out utility buttons."""
-    
-    all_buttons = driver.find_elements(By.CSS_SELECTOR, 'main button')
-    place_buttons = []
+def is_place_button(text: str, aria: str) -> bool:
+    """Tell place buttons apart from utility buttons by their text and aria-label."""
+    # Skip utility buttons
+    if _SKIP_RE.search(aria) or _SKIP_RE.search(text):
+        return False
     
-    # Words that indicate utility buttons (not places)
-    skip_words = [
-        'delete', 'share', 'add a place', 'joined', 'edit', 'more options',
-        'note', 'close', 'back', 'search', 'menu', 'collapse', 'add note'
-    ]
+    # Skip empty and single-character buttons
+    return len(text.strip()) > 1
+
+
+def get_place_button_rows(driver: webdriver.Chrome) -> List[Tuple]:
+    """
+    Get (button, text, rating label, place href) for every place button in the list.
     
-    for btn in all_buttons:
-        try:
-            # Get aria-label and text
-            aria = (btn.get_attribute('aria-label') or '').lower()
-            text = btn.text.strip().lower()
-            
-            # Skip utility buttons
-            if any(skip in aria for skip in skip_words):
-                continue
-            if any(skip in text for skip in skip_words):
-                continue
-            
-            # Skip empty buttons
-            if not btn.text.strip():
-                continue
-            
-            # Skip single-character buttons
-            if len(btn.text.strip()) <= 1:
-                continue
-            
-            # This looks like a place button
-            place_buttons.append(btn)
-            
-        except StaleElementReferenceException:
-            continue
-        except Exception:
-            continue
+    One script call returns all of it, instead of separate text and
+    attribute round-trips per button.
+    """
+    all_buttons = driver.execute_script(
+        _LIST_BUTTONS_JS, _PLACE_BUTTON_SELECTOR, _RATING_IMG_SELECTOR, _PLACE_LINK_SELECTOR
+    )
     
-    return place_buttons
+    return [
+        (btn, text, rating_aria, href)
+        for btn, text, aria, rating_aria, href in all_buttons
+        if is_place_button(text, aria)
+    ]
+
+
+def get_place_button_row(driver: webdriver.Chrome, index: int) -> Optional[Tuple]:
+    """Get (button, text, rating label, place href) for the index-th place button, or None."""
+    return driver.execute_script(
+        _PLACE_BUTTON_AT_JS, _PLACE_BUTTON_SELECTOR, _RATING_IMG_SELECTOR, _PLACE_LINK_SELECTOR,
+        _SKIP_RE.pattern, index
+    )
+
+
+def get_place_buttons(driver: webdriver.Chrome) -> List:
+    """Get all place buttons from the list, filtering out utility buttons."""
+    return [row[0] for row in get_place_button_rows(driver)]
 
 
 def scroll_and_collect_places(driver: webdriver.Chrome, scroll_pause: float = 2.0, max_scrolls: int = 100) -> int:
-    """Scroll the list to load all places."""
-    print("Scrolling to load all places...")
+    """
+    Scroll the list to load all places.
     
-    last_count = 0
-    no_change_count = 0
-    scroll_count = 0
+    The scroll / wait / count loop runs inside the browser as one async
+    script, so it costs a single WebDriver round-trip however long the list.
+    """
+    print("Scrolling to load all places...")
     
     # Find scrollable element
     try:
         main_elem = driver.find_element(By.CSS_SELECTOR, 'main')
-    except:
+    except NoSuchElementException:
         main_elem = driver.find_element(By.TAG_NAME, 'body')
     
-    while scroll_count < max_scrolls:
-        # Count current places
-        place_buttons = get_place_buttons(driver)
-        current_count = len(place_buttons)
-        
-        print(f"Scroll {scroll_count + 1}: Found {current_count} places")
-        
-        # Check if we've reached the end
-        if current_count == last_count:
-            no_change_count += 1
-            if no_change_count >= 3:
-                print(f"Reached end of list")
-                break
-        else:
-            no_change_count = 0
-        
-        last_count = current_count
-        
-        # Scroll down using multiple methods
-        try:
-            driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", main_elem)
-        except:
-            pass
-        
-        try:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
-        except:
-            pass
-        
-        try:
-            ActionChains(driver).send_keys(Keys.END).perform()
-        except:
-            pass
-        
-        time.sleep(scroll_pause)
-        scroll_count += 1
+    # Allow the whole loop to run: every scroll waits at most scroll_pause
+    previous_timeout = driver.timeouts.script
+    driver.set_script_timeout(max_scrolls * (scroll_pause + 1) + 30)
+    try:
+        scroll_count = driver.execute_async_script(
+            _SCROLL_UNTIL_STABLE_JS, main_elem, _PLACE_BUTTON_SELECTOR, scroll_pause * 1000, max_scrolls
+        )
+    except TimeoutException:
+        scroll_count = max_scrolls
+        print("Warning: Timeout while scrolling, continuing with what has loaded")
+    finally:
+        driver.set_script_timeout(previous_timeout)
     
     final_count = len(get_place_buttons(driver))
-    print(f"Scrolling complete. Found {final_count} places.")
+    print(f"Scrolling complete after {scroll_count} scrolls. Found {final_count} places.")
     return final_count
 
 
-def click_place_and_extract(driver: webdriver.Chrome, button, city: str, index: int) -> Optional[Dict]:
+def parse_place_text(text: str, rating_aria: Optional[str], city: str) -> Optional[Dict]:
     """
-    Click on a place button to select it and extract all data including notes.
+    Build a place record from a list button's text and rating label.
+    
+    Returns None for empty or utility buttons.
     """
+    # Keys follow COLUMN_ORDER so records need no reordering for output
     place_data = {
         'city': city,
         'place': None,
@@ -229,137 +536,201 @@ def click_place_and_extract(driver: webdriver.Chrome, button, city: str, index:
         'review_count': None,
         'price_range': None,
         'note': None,
-        'website': None,
         'phone': None,
+        'website': None,
         'lat': None,
         'lng': None,
         'url': None
     }
     
-    try:
-        # First, extract basic info from the button text
-        full_text = button.text.strip()
-        if not full_text:
+    full_text = (text or '').strip()
+    if not full_text:
+        return None
+    
+    lines = full_text.split('\n')
+    
+    # First line is the place name
+    if lines:
+        place_name = lines[0].strip()
+        if place_name.lower() in _SKIP_NAMES:
             return None
+        place_data['place'] = place_name
+    
+    # Extract rating from img aria-label
+    match = _RATING_RE.match(rating_aria or '')
+    if match:
+        place_data['rating'] = match.group(1)
+        place_data['review_count'] = match.group(2).replace(',', '')
+    
+    # Parse remaining lines
+    for line in lines[1:]:
+        line = line.strip()
+        if not line:
+            continue
         
-        lines = full_text.split('\n')
+        # Skip rating lines (already extracted)
+        if _NUM_RE.match(line):
+            continue
+        if _PAREN_NUM_RE.match(line):
+            continue
         
-        # First line is the place name
-        if lines:
-            place_name = lines[0].strip()
-            if place_name.lower() in ['delete', 'share', 'add a place', 'joined', 'note', 'add note']:
-                return None
-            place_data['place'] = place_name
+        # Price range
+        if _PRICE_RE.match(line) or 'priced' in line.lower():
+            place_data['price_range'] = line
+            continue
         
-        # Extract rating from img aria-label
-        try:
-            rating_img = button.find_element(By.CSS_SELECTOR, 'img[aria-label*="star"]')
-            aria = rating_img.get_attribute('aria-label') or ''
-            match = re.match(r'(\d+\.?\d*)\s*stars?\s*([0-9,]+)\s*Reviews?', aria, re.IGNORECASE)
-            if match:
-                place_data['rating'] = match.group(1)
-                place_data['review_count'] = match.group(2).replace(',', '')
-        except NoSuchElementException:
-            pass
+        # Address with "Nearby Address:" prefix
+        if 'nearby address:' in line.lower():
+            place_data['address'] = line.split(':', 1)[1].strip()
+            continue
         
-        # Parse remaining lines
-        for line in lines[1:]:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Skip rating lines (already extracted)
-            if re.match(r'^\d+\.?\d*$', line):
-                continue
-            if re.match(r'^\([0-9,]+\)$', line):
-                continue
-            
-            # Price range
-            if re.match(r'^[€$£¥]', line) or 'priced' in line.lower():
-                place_data['price_range'] = line
-                continue
-            
-            # Address with "Nearby Address:" prefix
-            if 'nearby address:' in line.lower():
-                place_data['address'] = line.split(':', 1)[1].strip()
-                continue
-            
-            # Short text without numbers = category
-            if len(line) < 50 and not any(c.isdigit() for c in line):
-                if line.lower() not in ['temporarily closed', 'permanently closed']:
-                    if not place_data['category']:
-                        place_data['category'] = line
-                continue
-            
-            # Longer text with numbers = address
-            if any(c.isdigit() for c in line) and len(line) > 5:
-                if not place_data['address']:
-                    place_data['address'] = line
+        has_digit = _HAS_DIGIT(line) is not None
+        
+        # Short text without numbers = category
+        if len(line) < 50 and not has_digit:
+            if line.lower() not in ['temporarily closed', 'permanently closed']:
+                if not place_data['category']:
+                    place_data['category'] = line
+            continue
+        
+        # Longer text with numbers = address
+        if has_digit and len(line) > 5:
+            if not place_data['address']:
+                place_data['address'] = line
+    
+    return place_data
+
+
+def set_place_url(place_data: Dict, url: str) -> None:
+    """Record a /place/ URL and the coordinates embedded in it."""
+    if '/place/' not in url:
+        return
+    place_data['url'] = url
+    # Extract lat/lng from URL
+    lat_lng_match = _LATLNG_RE.search(url)
+    if lat_lng_match:
+        place_data['lat'] = lat_lng_match.group(1)
+        place_data['lng'] = lat_lng_match.group(2)
+
+
+def place_key(place_data: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Key used to drop duplicate places in every extraction path.
+    
+    Name plus address: re-rendered copies of a row share both, while
+    same-named places at different addresses (chain branches) are kept.
+    Both come from the list text, so the key is known before clicking.
+    """
+    return (place_data['place'], place_data['address'])
+
+
+def click_place_and_extract(
+    driver: webdriver.Chrome,
+    button,
+    city: str,
+    index: int,
+    text: Optional[str] = None,
+    rating_aria: Optional[str] = None,
+    href: Optional[str] = None,
+    wait_for_note: bool = False
+) -> Optional[Dict]:
+    """
+    Click on a place button to select it and extract all data including notes.
+    
+    text and rating_aria can be passed in when already fetched (see
+    get_place_button_rows) to save reading them from the button again.
+    href, the place link from the list, fills in url and lat/lng up front;
+    the URL the click navigates to takes precedence when it changes.
+    wait_for_note makes the post-click wait hold out for the note text
+    instead of ending on the URL change, for rows known to have a note.
+    """
+    try:
+        if text is None:
+            # First, read the button text and rating label in one round-trip
+            bundle = driver.execute_script(_PLACE_BUNDLE_JS, button, _RATING_IMG_SELECTOR)
+            text, rating_aria = bundle['text'], bundle['ratingAria']
+        
+        place_data = parse_place_text(text, rating_aria, city)
+        if not place_data:
+            return None
+        
+        if href:
+            set_place_url(place_data, href)
         
         # Now click the button to select it and reveal the note
+        previous_url = driver.current_url
         try:
-            button.click()
-            time.sleep(0.5)
-        except ElementClickInterceptedException:
-            # Try scrolling the button into view
-            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-            time.sleep(0.3)
-            button.click()
-            time.sleep(0.5)
+            try:
+                button.click()
+            except ElementClickInterceptedException:
+                # Try scrolling the button into view
+                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
+                button.click()
+        except TimeoutException:
+            # The click started a load that hit the page load timeout; stop it
+            # and keep what the list already gave us rather than waiting
+            print(f"  Timed out selecting {place_data['place']}, skipping note")
+            driver.execute_script('window.stop();')
+            current_url = driver.current_url
+            if current_url != previous_url:
+                set_place_url(place_data, current_url)
+            return place_data
+        
+        # Selecting a place navigates to its /place/ URL or fills in its note;
+        # wait for either rather than sleeping a fixed time. A re-render can
+        # leave button stale mid-wait, which just means polling on the URL
+        try:
+            WebDriverWait(driver, 2, ignored_exceptions=(StaleElementReferenceException,)).until(
+                lambda d: (
+                    not wait_for_note and d.current_url != previous_url and '/place/' in d.current_url
+                )
+                or d.execute_script(_NOTE_FILLED_JS, button, _NOTE_SELECTOR)
+            )
+        except TimeoutException:
+            pass
         
         # After clicking, look for the note in the expanded area
         # Notes appear in textarea elements or as plain text below the place
         try:
-            # Method 1: Find textarea with aria-label="Note" near this button
-            parent = button.find_element(By.XPATH, '..')
-            note_areas = parent.find_elements(By.CSS_SELECTOR, 'textarea[aria-label="Note"]')
-            for note_area in note_areas:
-                note_text = note_area.get_attribute('value') or note_area.text
-                if note_text and note_text.strip():
-                    place_data['note'] = note_text.strip()
-                    break
-        except:
-            pass
+            note_bundle = driver.execute_script(_NOTE_BUNDLE_JS, button, _NOTE_SELECTOR)
+        except WebDriverException:
+            note_bundle = None
         
-        if not place_data['note']:
-            try:
+        if note_bundle:
+            # Method 1: Find textarea with aria-label="Note" near this button
+            if note_bundle['textarea']:
+                place_data['note'] = note_bundle['textarea'].strip()
+            
+            if not place_data['note']:
                 # Method 2: Look for note text that appears after clicking
                 # Notes often contain URLs or are multi-line text below the place info
-                grandparent = button.find_element(By.XPATH, '../..')
-                all_text = grandparent.text
+                all_text = note_bundle['grandparentText'] or ''
                 
                 # Look for text that's not part of the button
-                button_text = button.text
+                button_text = note_bundle['buttonText'] or ''
                 remaining_text = all_text.replace(button_text, '').strip()
                 
                 # If there's remaining text and it's not a utility word
                 if remaining_text:
-                    skip_texts = ['delete', 'note', 'add note', '+']
                     lines = remaining_text.split('\n')
                     note_lines = []
                     for line in lines:
                         line = line.strip()
-                        if line and line.lower() not in skip_texts and len(line) > 2:
+                        if line and line.lower() not in _NOTE_SKIP_LINES and len(line) > 2:
                             # Check if it looks like a note (contains URL or is descriptive text)
                             if 'http' in line.lower() or 'www.' in line.lower():
                                 note_lines.append(line)
-                            elif len(line) > 10 and not re.match(r'^[\d\.\(\)]+$', line):
+                            elif len(line) > 10 and not _NUMPUNCT_RE.match(line):
                                 note_lines.append(line)
                     
                     if note_lines:
                         place_data['note'] = '\n'.join(note_lines)
-            except:
-                pass
         
-        # Get the URL from the current page if it changed
+        # Get the URL from the current page if it changed; otherwise it
+        # still belongs to the previously selected place
         current_url = driver.current_url
-        if '/place/' in current_url:
-            place_data['url'] = current_url
-            # Extract lat/lng from URL
-            lat_lng_match = re.search(r'@(-?\d+\.?\d*),(-?\d+\.?\d*)', current_url)
-            if lat_lng_match:
-                place_data['lat'] = lat_lng_match.group(1)
-                place_data['lng'] = lat_lng_match.group(2)
+        if current_url != previous_url:
+            set_place_url(place_data, current_url)
         
         return place_data
         
@@ -371,38 +742,43 @@ def click_place_and_extract(driver: webdriver.Chrome, button, city: str, index:
         return None
 
 
-def extract_all_places(driver: webdriver.Chrome, city: str) -> List[Dict]:
-    """Extract all places from the list by clicking each one."""
-    places = []
-    seen_names = set()
+def extract_all_places(driver: webdriver.Chrome, city: str, indices: Optional[range] = None) -> List[Dict]:
+    """
+    Extract all places from the list by clicking each one.
+    
+    If indices is given, only the place buttons at those positions are
+    processed (see extract_all_places_parallel).
+    """
+    # Keyed on place_key so a re-rendered row is recognised before clicking
+    # it; dicts keep insertion order, so this is also the output
+    places: Dict[Tuple, Dict] = {}
     
     print("\nExtracting place details...")
     
-    # Get all place buttons
-    place_buttons = get_place_buttons(driver)
-    total = len(place_buttons)
+    total = len(get_place_button_rows(driver))
     print(f"Found {total} places to process")
     
-    for i, button in enumerate(place_buttons):
+    for i in (indices if indices is not None else range(total)):
         try:
-            # Re-find buttons periodically as DOM may change
-            if i > 0 and i % 10 == 0:
-                place_buttons = get_place_buttons(driver)
-                if i < len(place_buttons):
-                    button = place_buttons[i]
-                else:
-                    break
+            # Look the button up fresh by index every time, so a re-render
+            # caused by the previous click never leaves us a stale reference
+            row = get_place_button_row(driver, i)
+            if row is None:
+                break
+            button, text, rating_aria, href = row
+            
+            # Skip utility rows and duplicates without clicking them
+            parsed = parse_place_text(text, rating_aria, city)
+            if not parsed or place_key(parsed) in places:
+                continue
             
             # Extract data
-            place_data = click_place_and_extract(driver, button, city, i)
+            place_data = click_place_and_extract(
+                driver, button, city, i, text=text, rating_aria=rating_aria, href=href
+            )
             
             if place_data and place_data['place']:
-                # Skip duplicates
-                if place_data['place'] in seen_names:
-                    continue
-                
-                seen_names.add(place_data['place'])
-                places.append(place_data)
+                places[place_key(place_data)] = place_data
                 
                 note_indicator = " (has note)" if place_data.get('note') else ""
                 print(f"  [{i+1}/{total}] {place_data['place']}{note_indicator}")
@@ -412,7 +788,164 @@ def extract_all_places(driver: webdriver.Chrome, city: str) -> List[Dict]:
             continue
     
     print(f"\nExtracted {len(places)} places total")
-    return places
+    return list(places.values())
+
+
+def _extract_places_in_new_browser(
+    url: str,
+    city: str,
+    indices: range,
+    expected_total: int,
+    driver_path: str,
+    headless: bool,
+    scroll_pause: float,
+    max_scrolls: int
+) -> List[Dict]:
+    """
+    Load the list in a browser of its own and extract the places at indices.
+    
+    expected_total is the place count the main browser saw; a different
+    count here means the indices may not line up, which is logged.
+    """
+    driver = setup_driver(headless=headless, driver_path=driver_path)
+    try:
+        load_list_url(driver, url)
+        wait_for_list_load(driver, timeout=30)
+        scroll_and_collect_places(driver, scroll_pause=scroll_pause, max_scrolls=max_scrolls)
+        total = len(get_place_button_rows(driver))
+        if total != expected_total:
+            print(
+                f"  Warning: worker for places {indices.start + 1}-{indices.stop} found {total} places, "
+                f"main browser found {expected_total}; some places may be skipped or repeated"
+            )
+        return extract_all_places(driver, city, indices=indices)
+    finally:
+        driver.quit()
+
+
+def extract_all_places_parallel(
+    driver: webdriver.Chrome,
+    url: str,
+    city: str,
+    workers: int,
+    headless: bool = True,
+    scroll_pause: float = 2.0,
+    max_scrolls: int = 100
+) -> List[Dict]:
+    """
+    Split the click-and-extract phase across several browsers.
+    
+    A WebDriver session can only drive one tab at a time, so each extra
+    worker starts its own browser, loads and scrolls the same list, and
+    clicks through a contiguous slice of the place buttons. driver handles
+    the first slice itself. Places come back in list order.
+    
+    Each browser scrolls the list on its own, so index i is not guaranteed
+    to be the same place in every browser: if the lists load differently,
+    places can be skipped or picked up twice. Differing place counts are
+    logged. A slice whose browser fails is logged and left out, and the
+    other slices are still returned.
+    """
+    total = len(get_place_button_rows(driver))
+    slice_size = max(1, -(-total // workers))
+    slices = [range(start, min(start + slice_size, total)) for start in range(0, total, slice_size)]
+    if len(slices) <= 1:
+        return extract_all_places(driver, city)
+    
+    print(f"\nSplitting {total} places across {len(slices)} browsers")
+    
+    # Resolve chromedriver once here: resolving it in every thread could run
+    # several webdriver_manager installs and cache writes at the same time
+    try:
+        driver_path = get_chromedriver_path()
+    except Exception as e:
+        print(f"  Could not resolve chromedriver for extra browsers ({e}), using one browser")
+        return extract_all_places(driver, city)
+    
+    with ThreadPoolExecutor(max_workers=len(slices) - 1) as executor:
+        futures = [
+            executor.submit(
+                _extract_places_in_new_browser,
+                url, city, indices, total, driver_path, headless, scroll_pause, max_scrolls
+            )
+            for indices in slices[1:]
+        ]
+        slice_places = [extract_all_places(driver, city, indices=slices[0])]
+        for indices, future in zip(slices[1:], futures):
+            try:
+                slice_places.append(future.result())
+            except Exception as e:
+                print(f"  Worker for places {indices.start + 1}-{indices.stop} failed: {e}")
+    
+    # Merge in list order, dropping places picked up by more than one slice
+    places: Dict[Tuple, Dict] = {}
+    for place_data in (place for chunk in slice_places for place in chunk):
+        places.setdefault(place_key(place_data), place_data)
+    
+    print(f"\nExtracted {len(places)} places total")
+    return list(places.values())
+
+
+def extract_places_fast(driver: webdriver.Chrome, city: str) -> List[Dict]:
+    """
+    Extract all places straight from the list DOM in one script call.
+    
+    Only rows whose note textarea is present but still empty are clicked,
+    to load the note, so this is much faster than extract_all_places. Notes
+    the list shows no textarea for are missed, and url/lat/lng are only
+    found when the row links to its /place/ page.
+    """
+    places: Dict[Tuple, Dict] = {}
+    # (place index, record) for rows whose note only loads on click
+    pending_notes = []
+    
+    print("\nExtracting place details (fast mode)...")
+    
+    rows = driver.execute_script(
+        _FAST_EXTRACT_JS, _PLACE_BUTTON_SELECTOR, _RATING_IMG_SELECTOR, _NOTE_SELECTOR, _PLACE_LINK_SELECTOR
+    )
+    
+    place_index = -1
+    for row in rows:
+        if not is_place_button(row['text'], row['aria']):
+            continue
+        # Position among place buttons, as used by get_place_button_row
+        place_index += 1
+        
+        place_data = parse_place_text(row['text'], row['ratingAria'], city)
+        if not place_data or not place_data['place']:
+            continue
+        
+        if row['note'] and row['note'].strip():
+            place_data['note'] = row['note'].strip()
+        if row['href']:
+            set_place_url(place_data, row['href'])
+        
+        # Skip duplicates, keyed the same way as extract_all_places
+        key = place_key(place_data)
+        if key in places:
+            continue
+        
+        places[key] = place_data
+        if row['hasNoteArea'] and not place_data['note']:
+            pending_notes.append((place_index, place_data))
+    
+    if pending_notes:
+        print(f"Clicking {len(pending_notes)} places to load their notes...")
+    for index, place_data in pending_notes:
+        row = get_place_button_row(driver, index)
+        if row is None:
+            continue
+        button, text, rating_aria, href = row
+        clicked = click_place_and_extract(
+            driver, button, city, index, text=text, rating_aria=rating_aria, href=href, wait_for_note=True
+        )
+        # Only take the note if the row at index is still the same place
+        if clicked and place_key(clicked) == place_key(place_data) and clicked['note']:
+            place_data['note'] = clicked['note']
+    
+    print(f"\nExtracted {len(places)} places total")
+    return list(places.values())
 
 
 def scrape_google_maps_list(
@@ -422,9 +955,20 @@ def scrape_google_maps_list(
     headless: bool = True,
     scroll_pause: float = 2.0,
     max_scrolls: int = 100,
-    return_format: str = 'dict'
+    return_format: str = 'dict',
+    driver: Optional[webdriver.Chrome] = None,
+    fast_mode: bool = False,
+    click_workers: int = 1
 ) -> dict:
-    """Main function to scrape a Google Maps saved list."""
+    """
+    Main function to scrape a Google Maps saved list.
+    
+    If driver is given it is used as-is and left open; otherwise a browser
+    is started for this call and closed when it finishes. fast_mode reads
+    places from the list without clicking them (see extract_places_fast).
+    click_workers > 1 spreads the clicking over that many browsers (see
+    extract_all_places_parallel).
+    """
     
     start_time = timeit.default_timer()
     result = {
@@ -437,7 +981,7 @@ def scrape_google_maps_list(
         'city': city
     }
     
-    driver = None
+    owns_driver = driver is None
     
     try:
         print("=" * 60)
@@ -447,59 +991,45 @@ def scrape_google_maps_list(
         print(f"City: {city}")
         print("=" * 60)
         
-        print("\nInitializing browser...")
-        driver = setup_driver(headless=headless)
+        if owns_driver:
+            print("\nInitializing browser...")
+            driver = setup_driver(headless=headless)
         
         print(f"Loading URL...")
-        driver.get(url)
-        
-        # Wait for page - longer initial wait
-        print("Initial page load wait...")
-        time.sleep(8)
+        load_list_url(driver, url)
         
-        # Try to load the list
+        # Try to load the list (driver.get returns early with the eager
+        # page load strategy; this waits on the list itself)
         wait_for_list_load(driver, timeout=30)
         
-        # Take extra time for dynamic content
-        time.sleep(3)
-        
         # Debug: print page title and check for content
         print(f"Page title: {driver.title}")
         
         # Check if we have any content
         try:
-            body = driver.find_element(By.TAG_NAME, 'body')
-            body_text = body.text[:500] if body.text else "No text"
-            print(f"Page content preview: {body_text[:200]}...")
-        except:
+            # Truncate in the browser rather than shipping the whole page text
+            body_text = driver.execute_script(_BODY_TEXT_PREVIEW_JS, 200) or "No text"
+            print(f"Page content preview: {body_text}...")
+        except WebDriverException:
             print("Could not get page content")
         
         # Scroll to load all places
         scroll_and_collect_places(driver, scroll_pause=scroll_pause, max_scrolls=max_scrolls)
         
-        # Wait after scrolling
-        time.sleep(2)
-        
         # Extract all places
-        places = extract_all_places(driver, city=city)
-        
-        # Create DataFrame
-        df = pd.DataFrame(places)
-        
-        # Reorder columns
-        column_order = ['city', 'place', 'address', 'category', 'rating', 'review_count', 
-                       'price_range', 'note', 'phone', 'website', 'lat', 'lng', 'url']
-        df = df[[col for col in column_order if col in df.columns]]
+        if fast_mode:
+            places = extract_places_fast(driver, city=city)
+        elif click_workers > 1:
+            places = extract_all_places_parallel(
+                driver, url, city, click_workers,
+                headless=headless, scroll_pause=scroll_pause, max_scrolls=max_scrolls
+            )
+        else:
+            places = extract_all_places(driver, city=city)
         
         # Save to file
         if output_file:
-            os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
-            
-            if output_file.endswith('.json'):
-                df.to_json(output_file, orient='records', indent=2)
-            else:
-                df.to_csv(output_file, index=False)
-            print(f"\nSaved results to: {output_file}")
+            save_places(places, output_file)
         
         execution_time = timeit.default_timer() - start_time
         
@@ -509,9 +1039,10 @@ def scrape_google_maps_list(
         result['execution_time'] = round(execution_time, 2)
         
         if return_format == 'dataframe':
-            result['data'] = df
+            import pandas as pd
+            result['data'] = pd.DataFrame(places, columns=COLUMN_ORDER)
         else:
-            result['data'] = df.to_dict('records')
+            result['data'] = places
         
     except Exception as e:
         result['message'] = f'Error: {str(e)}'
@@ -520,37 +1051,263 @@ def scrape_google_maps_list(
         traceback.print_exc()
         
     finally:
-        if driver:
+        if driver and owns_driver:
             driver.quit()
             print("\nBrowser closed")
     
     return result
 
 
+class ScraperSession:
+    """
+    Reuse one Chrome instance across several list scrapes.
+    
+    Each scrape runs in its own tab, which is closed afterwards, so Chrome
+    startup and the disk cache are paid for once:
+    
+        with ScraperSession() as session:
+            barcelona = session.scrape(url1, city='Barcelona')
+            lisbon = session.scrape(url2, city='Lisbon')
+    """
+    
+    def __init__(
+        self,
+        headless: bool = True,
+        scroll_pause: float = 2.0,
+        max_scrolls: int = 100,
+        fast_mode: bool = False
+    ):
+        self.headless = headless
+        self.scroll_pause = scroll_pause
+        self.max_scrolls = max_scrolls
+        self.fast_mode = fast_mode
+        self.driver = None
+        self._home_window = None
+    
+    def __enter__(self) -> 'ScraperSession':
+        self.driver = setup_driver(headless=self.headless)
+        self._home_window = self.driver.current_window_handle
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+    
+    def scrape(
+        self,
+        url: str,
+        city: str = None,
+        output_file: Optional[str] = None,
+        return_format: str = 'dict'
+    ) -> dict:
+        """Scrape one list in a fresh tab of the shared browser."""
+        self.driver.switch_to.new_window('tab')
+        _block_heavy_requests(self.driver)
+        try:
+            return scrape_google_maps_list(
+                url,
+                city=city,
+                output_file=output_file,
+                scroll_pause=self.scroll_pause,
+                max_scrolls=self.max_scrolls,
+                return_format=return_format,
+                driver=self.driver,
+                fast_mode=self.fast_mode
+            )
+        finally:
+            self.driver.close()
+            self.driver.switch_to.window(self._home_window)
+
+
+def save_places(records: List[Dict], output_file: str) -> None:
+    """Write place records to a JSON or CSV file, chosen by extension."""
+    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
+    
+    if output_file.endswith('.json'):
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(dump_json(records, indent=True))
+    else:
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMN_ORDER, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(records)
+    print(f"\nSaved results to: {output_file}")
+
+
+def _failed_result(url: str, city: Optional[str], error: Exception) -> dict:
+    """Result for a list that could not be scraped, shaped like scrape_google_maps_list's."""
+    return {
+        'success': False,
+        'message': f'Error: {error}',
+        'data': [],
+        'count': 0,
+        'execution_time': 0,
+        'url': url,
+        'city': city
+    }
+
+
+def _scrape_in_session(jobs: List[Tuple[str, Optional[str]]], **session_options) -> List[dict]:
+    """
+    Scrape a share of scrape_many's lists in one browser (runs in a worker process).
+    
+    Errors are caught per list, so a list that breaks its tab, or a browser
+    that fails to start, only fails the lists it affects.
+    """
+    results = []
+    try:
+        with ScraperSession(**session_options) as session:
+            for url, city in jobs:
+                try:
+                    results.append(session.scrape(url, city=city))
+                except Exception as e:
+                    print(f"\nError scraping {url}: {e}")
+                    results.append(_failed_result(url, city, e))
+    except Exception as e:
+        # The browser failed to start or to shut down
+        print(f"\nBrowser error: {e}")
+        results.extend(_failed_result(url, city, e) for url, city in jobs[len(results):])
+    return results
+
+
+def scrape_many(
+    urls_and_cities: List[Tuple[str, Optional[str]]],
+    max_workers: Optional[int] = None,
+    headless: bool = True,
+    scroll_pause: float = 2.0,
+    max_scrolls: int = 100,
+    fast_mode: bool = False
+) -> List[dict]:
+    """
+    Scrape several lists concurrently across worker processes.
+    
+    Each worker starts one Chrome and scrapes its share of the lists in it
+    one tab at a time (see ScraperSession), so browser startup is paid once
+    per worker rather than once per list. Results are returned in the same
+    order as urls_and_cities. max_workers defaults to min(cpu_count, 4);
+    going higher mostly makes the browsers compete for CPU and memory.
+    """
+    jobs = list(urls_and_cities)
+    if not jobs:
+        return []
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, 4)
+    max_workers = max(1, min(max_workers, len(jobs)))
+    
+    session_options = {
+        'headless': headless,
+        'scroll_pause': scroll_pause,
+        'max_scrolls': max_scrolls,
+        'fast_mode': fast_mode
+    }
+    
+    results = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Deal the lists out round-robin so every worker gets a similar share
+        futures = [
+            executor.submit(_scrape_in_session, jobs[worker::max_workers], **session_options)
+            for worker in range(max_workers)
+        ]
+        for worker, future in enumerate(futures):
+            try:
+                results[worker::max_workers] = future.result()
+            except Exception as e:
+                # The worker process itself died
+                results[worker::max_workers] = [
+                    _failed_result(url, city, e) for url, city in jobs[worker::max_workers]
+                ]
+    
+    return results
+
+
+def read_urls_file(path: str, default_city: Optional[str] = None) -> List[Tuple[str, Optional[str]]]:
+    """
+    Read list URLs from a text file, one per line as "URL [city]".
+    
+    Blank lines and lines starting with '#' are ignored. Lines without a
+    city are tagged with default_city.
+    """
+    urls_and_cities = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split(None, 1)
+            city = parts[1].strip() if len(parts) > 1 else default_city
+            urls_and_cities.append((parts[0], city))
+    return urls_and_cities
+
+
+def merge_results(results: List[dict], execution_time: float, city: Optional[str] = None) -> dict:
+    """Combine per-list results from scrape_many into a single result."""
+    places = [place for result in results for place in result['data']]
+    failed = [result for result in results if not result['success']]
+    
+    if failed:
+        message = f'{len(failed)} of {len(results)} lists failed: ' + '; '.join(r['message'] for r in failed)
+    else:
+        message = f'Successfully scraped {len(places)} places from {len(results)} lists'
+    
+    return {
+        'success': not failed,
+        'message': message,
+        'data': places,
+        'count': len(places),
+        'execution_time': round(execution_time, 2),
+        'url': [result['url'] for result in results],
+        'city': city
+    }
+
+
 def main():
     """Command-line interface."""
     parser = argparse.ArgumentParser(description='Scrape Google Maps saved lists')
     
-    parser.add_argument('--url', '-u', required=True, help='Google Maps list URL')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--url', '-u', help='Google Maps list URL')
+    source.add_argument('--urls-file', help='Text file with one "URL [city]" per line, scraped in parallel')
     parser.add_argument('--city', '-c', default=None, help='City name to tag places')
     parser.add_argument('--output', '-o', default='google_maps_places.json', help='Output file path')
     parser.add_argument('--headless', action='store_true', default=True)
     parser.add_argument('--no-headless', action='store_true', help='Show browser window')
     parser.add_argument('--scroll-pause', type=float, default=2.0)
     parser.add_argument('--max-scrolls', type=int, default=100)
+    parser.add_argument('--fast', action='store_true', help='Read places without clicking them (notes and coordinates may be missing)')
+    parser.add_argument('--click-workers', type=int, default=1, help='Browsers used to click through a single list in parallel')
+    parser.add_argument('--workers', type=int, default=None, help='Parallel browsers for --urls-file (default: min(cpu_count, 4))')
     parser.add_argument('--json-output', action='store_true', help='Print JSON to stdout')
     
     args = parser.parse_args()
+    if args.urls_file and args.click_workers != 1:
+        parser.error('--click-workers only applies to a single --url; use --workers with --urls-file')
     headless = not args.no_headless
     
-    result = scrape_google_maps_list(
-        url=args.url,
-        city=args.city,
-        output_file=args.output,
-        headless=headless,
-        scroll_pause=args.scroll_pause,
-        max_scrolls=args.max_scrolls
-    )
+    if args.urls_file:
+        start_time = timeit.default_timer()
+        results = scrape_many(
+            read_urls_file(args.urls_file, default_city=args.city),
+            max_workers=args.workers,
+            headless=headless,
+            scroll_pause=args.scroll_pause,
+            max_scrolls=args.max_scrolls,
+            fast_mode=args.fast
+        )
+        result = merge_results(results, timeit.default_timer() - start_time, city=args.city)
+        if args.output:
+            save_places(result['data'], args.output)
+    else:
+        result = scrape_google_maps_list(
+            url=args.url,
+            city=args.city,
+            output_file=args.output,
+            headless=headless,
+            scroll_pause=args.scroll_pause,
+            max_scrolls=args.max_scrolls,
+            fast_mode=args.fast,
+            click_workers=args.click_workers
+        )
     
     if args.json_output:
         output = {
@@ -561,7 +1318,7 @@ def main():
             'city': result['city'],
             'data': result['data']
         }
-        print(json.dumps(output))
+        print(dump_json(output))
     else:
         print("\n" + "=" * 60)
         if result['success']: